@@ -278,7 +278,6 @@ class MonteCarloAnisotropicGalProf(MonteCarloGalProf):
         z = cos_t
         x_correlated_axes = np.vstack((x, y, z)).T
 
-        x_axes = np.tile((1, 0, 0), Npts).reshape((Npts, 3))
         major_axes = v1
 
         matrices = rotation_matrices_from_basis(v1,v2,v3)
@@ -6,12 +6,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import numpy as np
 
 # vector rotations
-from rotations import rotate_vector_collection
 from rotations.mcrotations import random_perpendicular_directions, random_unit_vectors_3d
-from rotations.vector_utilities import (elementwise_dot, elementwise_norm, normalized_vectors,
-                                        angles_between_list_of_vectors)
-from rotations.rotations3d import (vectors_between_list_of_vectors, vectors_normal_to_planes,
-                                   rotation_matrices_from_angles)
+from rotations.vector_utilities import elementwise_dot, elementwise_norm, normalized_vectors
+from rotations.rotations3d import vectors_between_list_of_vectors, vectors_normal_to_planes
 # watson distribution
 from watson_dist import DimrothWatson
 
@@ -31,6 +28,14 @@ __all__ = ('RandomAlignment',
 __author__ = ('Duncan Campbell',)
 
 
+# the distribution carries no per-call state, so one instance is shared by all calls
+_watson_dist = DimrothWatson()
+
+# indices into (A_v, B_v, C_v) of the galaxy major, intermediate, and minor axes
+# for each choice of the axis correlated with the alignment vector, `prim_gal_axis`
+_prim_gal_axis_order = {'A': (0, 1, 2), 'B': (1, 0, 2), 'C': (1, 2, 0)}
+
+
 class RandomAlignment(object):
     """
     class to model random galaxy orientations
@@ -82,17 +87,7 @@ class RandomAlignment(object):
                 if key not in table.keys():
                     table[key] = 0.0
 
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -187,12 +182,15 @@ class CentralAlignment(object):
             except KeyError:
                 msg = ('`central_alignment_strength` not detected in the table, using value in self.param_dict.')
                 warn(msg)
-                p = np.ones(len(Ax))*self.param_dict['central_alignment_strength']
+                p = self.param_dict['central_alignment_strength']
         else:
-            p = np.ones(len(Ax))*self.param_dict['central_alignment_strength']
+            p = self.param_dict['central_alignment_strength']
 
         # set prim_gal_axis orientation
-        major_input_vectors = np.vstack((Ax, Ay, Az)).T
+        major_input_vectors = np.empty((len(Ax), 3))
+        major_input_vectors[:, 0] = Ax
+        major_input_vectors[:, 1] = Ay
+        major_input_vectors[:, 2] = Az
         A_v = axes_correlated_with_input_vector(major_input_vectors, p=p)
 
         # randomly set secondary axis orientation
@@ -202,21 +200,12 @@ class CentralAlignment(object):
         C_v = vectors_normal_to_planes(A_v, B_v)
 
         # depending on the prim_gal_axis, assign correlated axes
-        if self.prim_gal_axis == 'A':
-            major_v = A_v
-            inter_v = B_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'B':
-            major_v = B_v
-            inter_v = A_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'C':
-            major_v = B_v
-            inter_v = C_v
-            minor_v = A_v
-        else:
+        try:
+            axis_order = _prim_gal_axis_order[self.prim_gal_axis]
+        except KeyError:
             msg = ('primary galaxy axis {0} is not recognized.'.format(self.prim_gal_axis))
             raise ValueError(msg)
+        major_v, inter_v, minor_v = [(A_v, B_v, C_v)[i] for i in axis_order]
 
         if 'table' in kwargs.keys():
             try:
@@ -233,17 +222,7 @@ class CentralAlignment(object):
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -338,12 +317,15 @@ class SatelliteAlignment(object):
             except KeyError:
                 msg = ('`satellite_alignment_strength` not detected in the table, using value in self.param_dict.')
                 warn(msg)
-                p = np.ones(len(Ax))*self.param_dict['satellite_alignment_strength']
+                p = self.param_dict['satellite_alignment_strength']
         else:
-            p = np.ones(len(Ax))*self.param_dict['satellite_alignment_strength']
+            p = self.param_dict['satellite_alignment_strength']
 
         # set prim_gal_axis orientation
-        major_input_vectors = np.vstack((Ax, Ay, Az)).T
+        major_input_vectors = np.empty((len(Ax), 3))
+        major_input_vectors[:, 0] = Ax
+        major_input_vectors[:, 1] = Ay
+        major_input_vectors[:, 2] = Az
         A_v = axes_correlated_with_input_vector(major_input_vectors, p=p)
 
         # randomly set secondary axis orientation
@@ -353,21 +335,12 @@ class SatelliteAlignment(object):
         C_v = vectors_normal_to_planes(A_v, B_v)
 
         # depending on the prim_gal_axis, assign correlated axes
-        if self.prim_gal_axis == 'A':
-            major_v = A_v
-            inter_v = B_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'B':
-            major_v = B_v
-            inter_v = A_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'C':
-            major_v = B_v
-            inter_v = C_v
-            minor_v = A_v
-        else:
+        try:
+            axis_order = _prim_gal_axis_order[self.prim_gal_axis]
+        except KeyError:
             msg = ('primary galaxy axis {0} is not recognized.'.format(self.prim_gal_axis))
             raise ValueError(msg)
+        major_v, inter_v, minor_v = [(A_v, B_v, C_v)[i] for i in axis_order]
 
         if 'table' in kwargs.keys():
             try:
@@ -384,17 +357,7 @@ class SatelliteAlignment(object):
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -466,11 +429,10 @@ class HaloMassCentralAlignmentStrength():
 
         a = self.param_dict['a']
         gamma = self.param_dict['gamma']
-        result = a*np.log10(m)+gamma
-        mask = (result < -0.99)
-        result[mask]= -0.99
-        mask = (result > 0.99)
-        result[mask]= 0.99
+        result = np.log10(m)
+        result *= a
+        result += gamma
+        np.clip(result, -0.99, 0.99, out=result)
         return result
 
 
@@ -518,7 +480,7 @@ class RadialSatelliteAlignment(object):
 
         # set default box size.
         if 'Lbox' in kwargs.keys():
-            self._Lbox = kwargs['Lbox']
+            self._Lbox = np.asarray(kwargs['Lbox'], dtype=float)
         else:
             self._Lbox = np.inf
         # update Lbox if a halo catalog object is passed.
@@ -545,7 +507,7 @@ class RadialSatelliteAlignment(object):
         inherit the box size during mock population
         """
         Lbox = kwargs['Lbox']
-        self._Lbox = Lbox
+        self._Lbox = np.asarray(Lbox, dtype=float)
 
     def assign_satellite_orientation(self, **kwargs):
         r"""
@@ -590,16 +552,15 @@ class RadialSatelliteAlignment(object):
                 msg = ('`satellite_alignment_strength` key not detected in `table`.'
                        'The value set in self.param_dict of this class will be used instead.')
                 warn(msg)
-                p = np.ones(len(table))*self.param_dict['satellite_alignment_strength']
+                p = self.param_dict['satellite_alignment_strength']
         else:
-            N = len(self.param_dict['x'])
-            p = np.ones(N*self.param_dict['satellite_alignment_strength'])
+            p = self.param_dict['satellite_alignment_strength']
 
         # set prim_gal_axis orientation
         A_v = axes_correlated_with_input_vector(major_input_vectors, p=p)
 
         # check for nan vectors
-        mask = (~np.isfinite(np.sum(np.prod(A_v, axis=-1))))
+        mask = ~np.all(np.isfinite(A_v), axis=-1)
         N_bad_axes = np.sum(mask)
         if N_bad_axes>0:
             A_v[mask,:] = random_unit_vectors_3d(N_bad_axes)
@@ -614,18 +575,12 @@ class RadialSatelliteAlignment(object):
         C_v = vectors_normal_to_planes(A_v, B_v)
 
         # depending on the prim_gal_axis, assign correlated axes
-        if self.prim_gal_axis == 'A':
-            major_v = A_v
-            inter_v = B_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'B':
-            major_v = B_v
-            inter_v = A_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'C':
-            major_v = B_v
-            inter_v = C_v
-            minor_v = A_v
+        try:
+            axis_order = _prim_gal_axis_order[self.prim_gal_axis]
+        except KeyError:
+            msg = ('primary galaxy axis {0} is not recognized.'.format(self.prim_gal_axis))
+            raise ValueError(msg)
+        major_v, inter_v, minor_v = [(A_v, B_v, C_v)[i] for i in axis_order]
 
         if 'table' in kwargs.keys():
             try:
@@ -642,17 +597,7 @@ class RadialSatelliteAlignment(object):
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -707,28 +652,7 @@ class RadialSatelliteAlignment(object):
 
         # define halo-center - satellite vector
         # accounting for PBCs
-        dx = (x - halo_x)
-        mask = dx>Lbox[0]/2.0
-        dx[mask] = dx[mask] - Lbox[0]
-        mask = dx<-1.0*Lbox[0]/2.0
-        dx[mask] = dx[mask] + Lbox[0]
-
-        dy = (y - halo_y)
-        mask = dy>Lbox[1]/2.0
-        dy[mask] = dy[mask] - Lbox[1]
-        mask = dy<-1.0*Lbox[1]/2.0
-        dy[mask] = dy[mask] + Lbox[1]
-
-        dz = (z - halo_z)
-        mask = dz>Lbox[2]/2.0
-        dz[mask] = dz[mask] - Lbox[2]
-        mask = dz<-1.0*Lbox[2]/2.0
-        dz[mask] = dz[mask] + Lbox[2]
-
-        r_vec = np.vstack((dx, dy, dz)).T
-        r = np.sqrt(np.sum(r_vec*r_vec, axis=-1))
-
-        return r_vec, r
+        return _pbc_radial_vector(x, y, z, halo_x, halo_y, halo_z, Lbox)
 
 
 class RadialSatelliteAlignmentStrength():
@@ -763,7 +687,7 @@ class RadialSatelliteAlignmentStrength():
         """
         """
         Lbox = kwargs['Lbox']
-        self._Lbox = Lbox
+        self._Lbox = np.asarray(Lbox, dtype=float)
 
     def assign_satellite_alignment_strength(self, **kwargs):
         """
@@ -806,26 +730,10 @@ class RadialSatelliteAlignmentStrength():
             Lbox = kwargs['Lbox']
 
         # define halo-center - satellite vector
-        dx = (x - halo_x)
-        mask = dx>Lbox[0]/2.0
-        dx[mask] = dx[mask] - Lbox[0]
-        mask = dx<-1.0*Lbox[0]/2.0
-        dx[mask] = dx[mask] + Lbox[0]
-
-        dy = (y - halo_y)
-        mask = dy>Lbox[1]/2.0
-        dy[mask] = dy[mask] - Lbox[1]
-        mask = dy<-1.0*Lbox[1]/2.0
-        dy[mask] = dy[mask] + Lbox[1]
-
-        dz = (z - halo_z)
-        mask = dz>Lbox[2]/2.0
-        dz[mask] = dz[mask] - Lbox[2]
-        mask = dz<-1.0*Lbox[2]/2.0
-        dz[mask] = dz[mask] + Lbox[2]
+        r_vec, r = _pbc_radial_vector(x, y, z, halo_x, halo_y, halo_z, Lbox)
 
         # calculate scaled halo virial radius
-        r = np.sqrt(dx**2 + dy**2 + dz**2)/halo_r
+        r /= halo_r
 
         s = self.alignment_strength_radial_dependence(r)
 
@@ -855,13 +763,11 @@ class RadialSatelliteAlignmentStrength():
         a = self.param_dict['a']
         gamma = self.param_dict['gamma']
 
+        # a*(1 - 1/(1 + (1/r)**gamma)) simplifies to a/(1 + r**gamma)
         with np.errstate(divide='ignore', invalid='ignore'):
-            result = np.where(r!=0, a*(1.0-1.0/(1.0+(1.0/r)**gamma)), 0.99)
+            result = np.where(r!=0, a/(1.0+r**gamma), 0.99)
 
-        mask = (result < -0.99)
-        result[mask]= -0.99
-        mask = (result > 0.99)
-        result[mask]= 0.99
+        np.clip(result, -0.99, 0.99, out=result)
 
         return result
 
@@ -886,14 +792,10 @@ class RadialSatelliteAlignmentStrength():
         ymax = 0.99
         ymin = -0.99
 
-        result = np.zeros(len(r))
-        result = (r/a)**gamma
-
-        mask = (result > ymax)
-        result[mask] = ymax
+        result = r/a
+        result **= gamma
 
-        mask = (result < ymin)
-        result[mask] = ymin
+        np.clip(result, ymin, ymax, out=result)
 
         return result
 
@@ -973,13 +875,15 @@ class MajorAxisSatelliteAlignment(object):
             except KeyError:
                 msg = ('`satellite_alignment_strength` not detected in the table, using value in self.param_dict.')
                 warn(msg)
-                p = np.ones(len(table))*self.param_dict['satellite_alignment_strength']
+                p = self.param_dict['satellite_alignment_strength']
         else:
-            N = len(self.param_dict['x'])
-            p = np.ones(N*self.param_dict['satellite_alignment_strength'])
+            p = self.param_dict['satellite_alignment_strength']
 
         # set halo alignment vector
-        major_input_vectors = np.vstack((Ax, Ay, Az)).T
+        major_input_vectors = np.empty((len(Ax), 3))
+        major_input_vectors[:, 0] = Ax
+        major_input_vectors[:, 1] = Ay
+        major_input_vectors[:, 2] = Az
 
         # set prim_gal_axis orientation
         A_v = axes_correlated_with_input_vector(major_input_vectors, p=p)
@@ -991,18 +895,12 @@ class MajorAxisSatelliteAlignment(object):
         C_v = vectors_normal_to_planes(A_v, B_v)
 
         # depending on the prim_gal_axis, assign correlated axes
-        if self.prim_gal_axis == 'A':
-            major_v = A_v
-            inter_v = B_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'B':
-            major_v = B_v
-            inter_v = A_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'C':
-            major_v = B_v
-            inter_v = C_v
-            minor_v = A_v
+        try:
+            axis_order = _prim_gal_axis_order[self.prim_gal_axis]
+        except KeyError:
+            msg = ('primary galaxy axis {0} is not recognized.'.format(self.prim_gal_axis))
+            raise ValueError(msg)
+        major_v, inter_v, minor_v = [(A_v, B_v, C_v)[i] for i in axis_order]
 
         if 'table' in kwargs.keys():
             try:
@@ -1014,17 +912,7 @@ class MajorAxisSatelliteAlignment(object):
                 print(msg)
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -1076,7 +964,7 @@ class HybridSatelliteAlignment(object):
         """
         """
         Lbox = kwargs['Lbox']
-        self._Lbox = Lbox
+        self._Lbox = np.asarray(Lbox, dtype=float)
 
     def assign_orientation(self, **kwargs):
         r"""
@@ -1085,6 +973,9 @@ class HybridSatelliteAlignment(object):
         """
         if 'table' in kwargs.keys():
             table = kwargs['table']
+            x = table['x']
+            y = table['y']
+            z = table['z']
             halo_x = table['halo_x']
             halo_y = table['halo_y']
             halo_z = table['halo_z']
@@ -1094,6 +985,9 @@ class HybridSatelliteAlignment(object):
             halo_r = table['halo_rvir']
             Lbox = self._Lbox
         else:
+            x = kwargs['x']
+            y = kwargs['y']
+            z = kwargs['z']
             halo_x = kwargs['halo_x']
             halo_y = kwargs['halo_y']
             halo_z = kwargs['halo_z']
@@ -1106,47 +1000,30 @@ class HybridSatelliteAlignment(object):
         Ngal = len(Ax)
 
         # define halo-center - satellite vector
-        dx = (x - halo_x)
-        mask = dx>Lbox[0]/2.0
-        dx[mask] = dx[mask] - Lbox[0]
-        mask = dx<-1.0*Lbox[0]/2.0
-        dx[mask] = dx[mask] + Lbox[0]
-
-        dy = (y - halo_y)
-        mask = dy>Lbox[1]/2.0
-        dy[mask] = dy[mask] - Lbox[1]
-        mask = dy<-1.0*Lbox[1]/2.0
-        dy[mask] = dy[mask] + Lbox[1]
-
-        dz = (z - halo_z)
-        mask = dz>Lbox[2]/2.0
-        dz[mask] = dz[mask] - Lbox[2]
-        mask = dz<-1.0*Lbox[2]/2.0
-        dz[mask] = dz[mask] + Lbox[2]
+        # accounting for PBCs
+        r_vec, r = _pbc_radial_vector(x, y, z, halo_x, halo_y, halo_z, Lbox)
 
         # radial vector
-        v1 = normalized_vectors(np.vstack((dx, dy, dz)).T)
+        v1 = r_vec/r[:, np.newaxis]
 
         # major axis orientation
-        v2 = normalized_vectors(np.vstack((Ax, Ay, Az)).T)
+        v2 = np.empty((Ngal, 3))
+        v2[:, 0] = Ax
+        v2[:, 1] = Ay
+        v2[:, 2] = Az
+        v2 /= np.sqrt(np.einsum('ij,ij->i', v2, v2))[:, np.newaxis]
 
         # account for handedness by randomly flipping alignment components
         seed = kwargs.get('seed', None)
-        with NumpyRNGContext(seed):
-             uran1 = np.random.random(Ngal)
-        if seed is not None:
-            seed = seed + 1
-        with NumpyRNGContext(seed):
-             uran2 = np.random.random(Ngal)
-        flip1 = np.ones(Ngal)
-        flip1[uran1 < 0.5] = -1.0
-        flip2 = np.ones(Ngal)
-        flip2[uran2 < 0.5] = -1.0
-        v1 = flip1[:, np.newaxis]*v1
-        v2 = flip2[:, np.newaxis]*v2
+        rng = np.random.default_rng(seed)
+        uran1, uran2 = rng.random((2, Ngal))
+        flip1 = np.where(uran1 < 0.5, -1.0, 1.0)
+        flip2 = np.where(uran2 < 0.5, -1.0, 1.0)
+        v1 *= flip1[:, np.newaxis]
+        v2 *= flip2[:, np.newaxis]
 
         # calculate scaled halo virial radius
-        r = np.sqrt(dx**2 + dy**2 + dz**2)/halo_r
+        r /= halo_r
 
          # get alignment strength for each galaxy
         if 'table' in kwargs.keys():
@@ -1155,10 +1032,9 @@ class HybridSatelliteAlignment(object):
             except KeyError:
                 msg = ('`satellite_alignment_strength` not detected in the table, using value in self.param_dict.')
                 warn(msg)
-                p = np.ones(len(table))*self.param_dict['satellite_alignment_strength']
+                p = self.param_dict['satellite_alignment_strength']
         else:
-            N = len(self.param_dict['x'])
-            p = np.ones(N*self.param_dict['satellite_alignment_strength'])
+            p = self.param_dict['satellite_alignment_strength']
 
         # get major to radial parameter
         a = self.radial_hybrid_alignment_vector_parameter(r)
@@ -1178,17 +1054,7 @@ class HybridSatelliteAlignment(object):
         mask = (table['gal_type'] == self.gal_type)
 
         # add orientations to the galaxy table
-        table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-        table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-        table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-        table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-        table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-        table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-        table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-        table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-        table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+        _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
         return table
 
@@ -1196,33 +1062,96 @@ class HybridSatelliteAlignment(object):
         """
         strength of alignment as a function of scaled halo-centric radius
         """
-        p = power_law(r, self.param_dict['satellite_alignment_a2'], self.param_dict['satellite_alignment_alpha2'])
-        p[p>=0.99]=0.99
+        a2 = self.param_dict['satellite_alignment_a2']
+        alpha2 = self.param_dict['satellite_alignment_alpha2']
+
+        # power law, a2*r**alpha2
+        p = np.power(r, alpha2)
+        p *= a2
+        np.minimum(p, 0.99, out=p)
         return p
 
     def radial_hybrid_alignment_vector_parameter(self, r):
         """
         hybrid alignment vector parameter
         """
-        a = power_law(r, self.param_dict['satellite_alignment_a1'], self.param_dict['satellite_alignment_alpha1'])
-        a[a>1.0]=1.0
+        a1 = self.param_dict['satellite_alignment_a1']
+        alpha1 = self.param_dict['satellite_alignment_alpha1']
+
+        # power law, a1*r**alpha1
+        a = np.power(r, alpha1)
+        a *= a1
+        np.minimum(a, 1.0, out=a)
         return a
 
 
+def _add_orientations_to_table(table, mask, major_v, inter_v, minor_v):
+    """
+    write the galaxy major, intermediate, and minor axes into the
+    `galaxy_axisA_*`, `galaxy_axisB_*`, and `galaxy_axisC_*` columns
+    of `table` for the rows selected by `mask`
+    """
+
+    # convert the mask to indices once, rather than once per column
+    idx = np.flatnonzero(mask)
+
+    for axis_letter, v in zip(('A', 'B', 'C'), (major_v, inter_v, minor_v)):
+        v = v[idx]
+        for i, component in enumerate(('x', 'y', 'z')):
+            table['galaxy_axis' + axis_letter + '_' + component][idx] = v[:, i]
+
+
+def _pbc_radial_vector(x, y, z, halo_x, halo_y, halo_z, Lbox):
+    """
+    calculate the radial vector between galaxies and their host haloes,
+    accounting for periodic boundary conditions (PBCs)
+
+    Parameters
+    ==========
+    x, y, z : array_like
+        galaxy positions
+
+    halo_x, halo_y, halo_z : array_like
+        host halo positions
+
+    Lbox : array_like
+        array len(3) giving the simulation box size along each dimension
+
+    Returns
+    =======
+    r_vec : numpy.array
+        array of radial vectors of shape (Ngal, 3) between host haloes and galaxies
+
+    r : numpy.array
+        radial distance
+    """
+
+    r_vec = np.empty((len(x), 3))
+    np.subtract(x, halo_x, out=r_vec[:, 0])
+    np.subtract(y, halo_y, out=r_vec[:, 1])
+    np.subtract(z, halo_z, out=r_vec[:, 2])
+
+    # wrap all three dimensions at once, broadcasting over `Lbox`.
+    # non-periodic (infinite) dimensions are left unwrapped.
+    Lbox = np.asarray(Lbox, dtype=float)
+    inv_Lbox = 1.0/Lbox
+    Lbox = np.where(np.isfinite(Lbox), Lbox, 0.0)
+    r_vec -= Lbox*np.rint(r_vec*inv_Lbox)
+
+    r = np.sqrt(np.einsum('ij,ij->i', r_vec, r_vec))
+
+    return r_vec, r
+
+
 def alignment_strength(p):
     r"""
     convert alignment strength argument to shape parameter for costheta distribution
     """
 
     p = np.atleast_1d(p)
-    k = np.zeros(len(p))
-    p_rescale = p*np.pi/2.0
-    k = np.tan(p_rescale)
-    mask = (p == 1.0)
-    k[mask] = np.inf
-    mask = (p == -1.0)
-    k[mask] = -1.0*np.inf
-    return -1.0*k
+    # tan is odd, so this is -1.0*tan(p*pi/2)
+    k = np.tan(p*(-np.pi/2.0))
+    return np.where(np.fabs(p) == 1.0, np.copysign(np.inf, -1.0*p), k)
 
 
 def inverse_alignment_strength(k):
@@ -1231,22 +1160,18 @@ def inverse_alignment_strength(k):
     """
 
     k = np.atleast_1d(k)
-    p = np.zeros(len(k))
+    # arctan(+-inf) = +-pi/2, so infinite `k` maps to p = -+1 without special cases
+    return np.arctan(k)*(-2.0/np.pi)
 
-    k = k
-    p = -1.0*np.arctan(k)/(np.pi/2.0)
 
-    return p
-
-
-def axes_correlated_with_z(p, seed=None):
+def axes_correlated_with_z(p, seed=None, size=None):
     r"""
     Calculate a list of 3d unit-vectors whose orientation is correlated
     with the z-axis (0, 0, 1).
     Parameters
     ----------
-    p : ndarray
-        Numpy array with shape (npts, ) defining the strength of the correlation
+    p : float or ndarray
+        Float or numpy array with shape (npts, ) defining the strength of the correlation
         between the orientation of the returned vectors and the z-axis.
         Positive (negative) values of `p` produce galaxy principal axes
         that are statistically aligned with the positive (negative) z-axis;
@@ -1256,6 +1181,10 @@ def axes_correlated_with_z(p, seed=None):
     seed : int, optional
         Random number seed used to choose a random orthogonal direction
 
+    size : int, optional
+        Number of vectors to return.  If not passed, this is the length of `p`.
+        A scalar `p` is applied to all `size` vectors.
+
     Returns
     -------
     unit_vectors : ndarray
@@ -1271,27 +1200,47 @@ def axes_correlated_with_z(p, seed=None):
     implemented with `scipy.stats.powerlaw`.
     """
 
-    p = np.atleast_1d(p)
-    npts = p.shape[0]
-
-    with NumpyRNGContext(seed):
-        phi = np.random.uniform(0, 2*np.pi, npts)
-        # sample cosine theta nonuniformily to correlate with in z-axis
-        if np.all(p == 0):
-            uran = np.random.uniform(0, 1, npts)
-            cos_t = uran*2.0 - 1.0
-        else:
-            k = alignment_strength(p)
-            d = DimrothWatson()
-            cos_t = d.rvs(k)
+    p = np.asarray(p)
+    if size is None:
+        npts = np.atleast_1d(p).shape[0]
+    else:
+        npts = size
+
+    # with seed=None the generator is seeded from OS entropy, so every
+    # unseeded call (including in forked worker processes) is independent
+    rng = np.random.default_rng(seed)
+
+    phi = rng.random(npts)
+    phi *= 2.0*np.pi
+
+    # sample cosine theta nonuniformily to correlate with in z-axis
+    if np.all(p == 0):
+        cos_t = rng.random(npts)
+        cos_t *= 2.0
+        cos_t -= 1.0
+    else:
+        k = alignment_strength(p)
+        if np.ndim(p) == 0:
+            # the watson distribution expects one shape parameter per point
+            k = np.full(npts, k[0])
+        # the watson distribution draws from the global numpy random state,
+        # which is restored afterwards
+        with NumpyRNGContext(seed):
+            cos_t = _watson_dist.rvs(k)
 
-    sin_t = np.sqrt((1.-cos_t*cos_t))
+    sin_t = np.multiply(cos_t, cos_t)
+    np.subtract(1.0, sin_t, out=sin_t)
+    np.sqrt(sin_t, out=sin_t)
 
-    x = sin_t * np.cos(phi)
-    y = sin_t * np.sin(phi)
-    z = cos_t
+    # evaluate each component in place in the output array
+    unit_vectors = np.empty((npts, 3))
+    np.cos(phi, out=unit_vectors[:, 0])
+    np.sin(phi, out=unit_vectors[:, 1])
+    unit_vectors[:, 0] *= sin_t
+    unit_vectors[:, 1] *= sin_t
+    unit_vectors[:, 2] = cos_t
 
-    return np.vstack((x, y, z)).T
+    return unit_vectors
 
 
 def axes_correlated_with_input_vector(input_vectors, p=0., seed=None):
@@ -1306,8 +1255,8 @@ def axes_correlated_with_input_vector(input_vectors, p=0., seed=None):
         preferred orientation with which the returned vectors will be correlated.
         Note that the normalization of `input_vectors` will be ignored.
 
-    p : ndarray, optional
-        Numpy array with shape (npts, ) defining the strength of the correlation
+    p : float or ndarray, optional
+        Float or numpy array with shape (npts, ) defining the strength of the correlation
         between the orientation of the returned vectors and the z-axis.
         Default is zero, for no correlation.
         Positive (negative) values of `p` produce galaxy principal axes
@@ -1324,18 +1273,75 @@ def axes_correlated_with_input_vector(input_vectors, p=0., seed=None):
         Numpy array of shape (npts, 3)
     """
 
+    input_vectors = np.atleast_2d(input_vectors)
+    npts = input_vectors.shape[0]
+
+    # randomly oriented vectors do not depend on `input_vectors`
+    if np.all(p == 0):
+        with NumpyRNGContext(seed):
+            return random_unit_vectors_3d(npts)
+
     input_unit_vectors = normalized_vectors(input_vectors)
     assert input_unit_vectors.shape[1] == 3
-    npts = input_unit_vectors.shape[0]
 
-    z_correlated_axes = axes_correlated_with_z(p, seed)
+    z_correlated_axes = axes_correlated_with_z(p, seed, size=npts)
+
+    # the z-correlated axes are not needed afterwards, so rotate them in place
+    return _rotate_z_to_vectors(input_unit_vectors, z_correlated_axes, out=z_correlated_axes)
+
+
+def _rotate_z_to_vectors(target_vectors, vectors, out=None):
+    r"""
+    Apply to each of `vectors` the rotation that takes the z-axis (0, 0, 1)
+    into the corresponding vector in `target_vectors`.
+
+    Parameters
+    ----------
+    target_vectors : ndarray
+        Numpy array of shape (npts, 3) storing a list of 3d unit-vectors
+
+    vectors : ndarray
+        Numpy array of shape (npts, 3) storing a list of 3d vectors to be rotated
+
+    out : ndarray, optional
+        Numpy array of shape (npts, 3) in which to store the result.
+        This may be `vectors` itself, in which case the rotation is done in place.
+
+    Returns
+    -------
+    rotated_vectors : ndarray
+        Numpy array of shape (npts, 3)
+
+    Notes
+    -----
+    Because the rotation always starts from the z-axis, the rotation axis is
+    :math:`\hat{z} \times \hat{v} = (-v_y, v_x, 0)` and :math:`\cos(\theta) = v_z`,
+    so Rodrigues' rotation formula can be applied directly without building
+    the (npts, 3, 3) array of rotation matrices.
+    """
+
+    vx, vy, vz = target_vectors[:, 0], target_vectors[:, 1], target_vectors[:, 2]
+    wx, wy, wz = vectors[:, 0], vectors[:, 1], vectors[:, 2]
+
+    # (1-cos)/sin^2 times the dot product of the (unnormalized) rotation axis and w
+    s2 = vx*vx + vy*vy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(vz >= 0.0, 1.0/(1.0 + vz), (1.0 - vz)/s2)*(vx*wy - vy*wx)
+
+    # target vectors anti-parallel to the z-axis are reached by a rotation of pi about the x-axis
+    mask = (s2 == 0.0) & (vz < 0.0)
+    anti_parallel = vectors[mask]*np.array([1.0, -1.0, -1.0])
 
-    z_axes = np.tile((0, 0, 1), npts).reshape((npts, 3))
+    if out is None:
+        out = np.empty(np.shape(vectors))
 
-    angles = angles_between_list_of_vectors(z_axes, input_unit_vectors)
-    rotation_axes = vectors_normal_to_planes(z_axes, input_unit_vectors)
-    matrices = rotation_matrices_from_angles(angles, rotation_axes)
+    # order the writes so that `out` may share memory with `vectors`
+    z = vz*wz - vx*wx - vy*wy
+    out[:, 0] = vz*wx + vx*wz - vy*f
+    out[:, 1] = vz*wy + vy*wz + vx*f
+    out[:, 2] = z
+    out[mask] = anti_parallel
 
-    return rotate_vector_collection(matrices, z_correlated_axes)
+    return out
 
 
@@ -559,8 +559,6 @@ class TriaxialNFW():
 
         x_correlated_axes = np.vstack((x, y, z)).T
 
-        x_axes = np.tile((1, 0, 0), Npts).reshape((Npts, 3))
-
         matrices = rotation_matrices_from_basis(host_major_axis,host_inter_axis,host_minor_axis)
 
         # rotate x-axis into the major axis
@@ -7,15 +7,16 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import numpy as np
 from astropy.utils.misc import NumpyRNGContext
 from scipy.optimize import minimize
-from rotations import rotate_vector_collection
 from rotations.mcrotations import random_perpendicular_directions, random_unit_vectors_3d
 from rotations.vector_utilities import (elementwise_dot, elementwise_norm, normalized_vectors,
                                         angles_between_list_of_vectors)
-from rotations.rotations3d import (vectors_between_list_of_vectors, vectors_normal_to_planes,
-                                   rotation_matrices_from_angles)
+from rotations.rotations3d import vectors_between_list_of_vectors, vectors_normal_to_planes
 from watson_dist import DimrothWatson
 from warnings import warn
 
+from intrinsic_alignments.ia_models.ia_model_components import (_add_orientations_to_table,
+                                                                 _prim_gal_axis_order)
+
 from scipy.stats import truncnorm
 from scipy.special import iv as modified_bessel
 from scipy.interpolate import interp1d
@@ -147,33 +148,33 @@ class Bett12SatelliteAlignment(object):
 
         # check for length 0 radial vectors
         mask = (r<=0.0) | (~np.isfinite(r))
-        if np.sum(mask)>0:
-            major_input_vectors[mask,0] = np.random.random((np.sum(mask)))
-            major_input_vectors[mask,1] = np.random.random((np.sum(mask)))
-            major_input_vectors[mask,2] = np.random.random((np.sum(mask)))
+        N_bad_axes = np.sum(mask)
+        if N_bad_axes>0:
+            major_input_vectors[mask,:] = random_unit_vectors_3d(N_bad_axes)
             msg = ('{0} galaxies have a radial distance equal to zero (or infinity) from their host. '
-                   'These galaxies will be re-assigned random alignment vectors.'.format(int(np.sum(mask))))
+                   'These galaxies will be re-assigned random alignment vectors.'.format(int(N_bad_axes)))
             warn(msg)
 
         # use direction perpendicular to the radial vector
         major_input_vectors = random_perpendicular_directions(major_input_vectors)
 
+        # number of satellites
+        N = len(major_input_vectors)
+
         # set prim_gal_axis orientation
         theta_ma = self.misalignment_rvs(size=N)
 
         # rotate alignment vector by theta_ma
         ran_vecs = random_unit_vectors_3d(N)
-        mrot = rotation_matrices_from_angles(theta_ma, ran_vecs)
-        A_v = rotate_vector_collection(rotm, major_input_vectors)
+        A_v = _rotate_vectors_about_axes(theta_ma, ran_vecs, major_input_vectors)
 
         # check for nan vectors
-        mask = (~np.isfinite(np.sum(np.prod(A_v, axis=-1))))
-        if np.sum(mask)>0:
-            A_v[mask,0] = np.random.random((np.sum(mask)))
-            A_v[mask,1] = np.random.random((np.sum(mask)))
-            A_v[mask,2] = np.random.random((np.sum(mask)))
+        mask = ~np.all(np.isfinite(A_v), axis=-1)
+        N_bad_axes = np.sum(mask)
+        if N_bad_axes>0:
+            A_v[mask,:] = random_unit_vectors_3d(N_bad_axes)
             msg = ('{0} correlated alignment axis(axes) were not found to be not finite. '
-                   'These will be re-assigned random vectors.'.format(int(np.sum(mask))))
+                   'These will be re-assigned random vectors.'.format(int(N_bad_axes)))
             warn(msg)
 
         # randomly set secondary axis orientation
@@ -202,17 +203,7 @@ class Bett12SatelliteAlignment(object):
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -419,30 +410,33 @@ class Knebe08SatelliteAlignment(object):
 
         # check for length 0 radial vectors
         mask = (r<=0.0) | (~np.isfinite(r))
-        if np.sum(mask)>0:
-            major_input_vectors[mask,0] = np.random.random((np.sum(mask)))
-            major_input_vectors[mask,1] = np.random.random((np.sum(mask)))
-            major_input_vectors[mask,2] = np.random.random((np.sum(mask)))
+        N_bad_axes = np.sum(mask)
+        if N_bad_axes>0:
+            major_input_vectors[mask,:] = random_unit_vectors_3d(N_bad_axes)
             msg = ('{0} galaxies have a radial distance equal to zero (or infinity) from their host. '
-                   'These galaxies will be re-assigned random alignment vectors.'.format(int(np.sum(mask))))
+                   'These galaxies will be re-assigned random alignment vectors.'.format(int(N_bad_axes)))
             warn(msg)
 
+        # number of satellites
+        N = len(major_input_vectors)
+
+        # rotate a unit vector, not the raw radial vector
+        major_input_vectors = normalized_vectors(major_input_vectors)
+
         # set prim_gal_axis orientation
         theta_ma = self.misalignment_rvs(size=N)
 
         # rotate alignment vector by theta_ma
         ran_vecs = random_unit_vectors_3d(N)
-        mrot = rotation_matrices_from_angles(theta_ma, ran_vecs)
-        A_v = rotate_vector_collection(rotm, major_input_vectors)
+        A_v = _rotate_vectors_about_axes(theta_ma, ran_vecs, major_input_vectors)
 
         # check for nan vectors
-        mask = (~np.isfinite(np.sum(np.prod(A_v, axis=-1))))
-        if np.sum(mask)>0:
-            A_v[mask,0] = np.random.random((np.sum(mask)))
-            A_v[mask,1] = np.random.random((np.sum(mask)))
-            A_v[mask,2] = np.random.random((np.sum(mask)))
+        mask = ~np.all(np.isfinite(A_v), axis=-1)
+        N_bad_axes = np.sum(mask)
+        if N_bad_axes>0:
+            A_v[mask,:] = random_unit_vectors_3d(N_bad_axes)
             msg = ('{0} correlated alignment axis(axes) were not found to be not finite. '
-                   'These will be re-assigned random vectors.'.format(int(np.sum(mask))))
+                   'These will be re-assigned random vectors.'.format(int(N_bad_axes)))
             warn(msg)
 
         # randomly set secondary axis orientation
@@ -471,17 +465,7 @@ class Knebe08SatelliteAlignment(object):
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -565,12 +549,27 @@ class Bett12CentralAlignment():
     central galaxy misalignment model for late-type galaixes 
     from Bett (2012), arxiv:1108.3717
     """
-    def __init__(self, gal_type='centrals', **kwargs):
+    def __init__(self, gal_type='centrals', prim_gal_axis='major', **kwargs):
         """
+        Parameters
+        ----------
+        prim_gal_axis :  string, optional
+            string indicating which galaxy principle axis is correlated with the halo alignment axis.
+            The options are: `major`, `intermediate`, and `minor`.
         """
 
         self.gal_type = gal_type
 
+        # set which galaxy axis is correlated with the halo alignment vector
+        possible_axis = ['major', 'intermediate', 'minor']
+        if prim_gal_axis in possible_axis:
+            if prim_gal_axis == possible_axis[0]: self.prim_gal_axis = 'A'
+            elif prim_gal_axis == possible_axis[1]: self.prim_gal_axis = 'B'
+            elif prim_gal_axis == possible_axis[2]: self.prim_gal_axis = 'C'
+        else:
+            msg = ('`prim_gal_axis` must be one of {0}, but instead is {1}.'.format(possible_axis, prim_gal_axis))
+            raise ValueError(msg)
+
         self._mock_generation_calling_sequence = (['assign_orientation'])
 
         self._galprop_dtypes_to_allocate = np.dtype(
@@ -660,13 +659,17 @@ class Bett12CentralAlignment():
         N = len(Ax)
 
         # set prim_gal_axis orientation
-        major_input_vectors = np.vstack((Ax, Ay, Az)).T
+        major_input_vectors = np.empty((N, 3))
+        major_input_vectors[:, 0] = Ax
+        major_input_vectors[:, 1] = Ay
+        major_input_vectors[:, 2] = Az
+        # the halo axes need not be unit vectors
+        major_input_vectors = normalized_vectors(major_input_vectors)
         theta_ma = self.misalignment_rvs(size=N)
 
         # rotate alignment vector by theta_ma
         ran_vecs = random_unit_vectors_3d(N)
-        mrot = rotation_matrices_from_angles(theta_ma, ran_vecs)
-        A_v = rotate_vector_collection(rotm, major_input_vectors)
+        A_v = _rotate_vectors_about_axes(theta_ma, ran_vecs, major_input_vectors)
 
         # randomly set secondary axis orientation
         B_v = random_perpendicular_directions(A_v)
@@ -675,21 +678,12 @@ class Bett12CentralAlignment():
         C_v = vectors_normal_to_planes(A_v, B_v)
 
         # depending on the prim_gal_axis, assign correlated axes
-        if self.prim_gal_axis == 'A':
-            major_v = A_v
-            inter_v = B_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'B':
-            major_v = B_v
-            inter_v = A_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'C':
-            major_v = B_v
-            inter_v = C_v
-            minor_v = A_v
-        else:
+        try:
+            axis_order = _prim_gal_axis_order[self.prim_gal_axis]
+        except KeyError:
             msg = ('primary galaxy axis {0} is not recognized.'.format(self.prim_gal_axis))
             raise ValueError(msg)
+        major_v, inter_v, minor_v = [(A_v, B_v, C_v)[i] for i in axis_order]
 
         if 'table' in kwargs.keys():
             try:
@@ -706,17 +700,7 @@ class Bett12CentralAlignment():
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
@@ -728,12 +712,27 @@ class Okumura09CentralAlignment():
     central galaxy misalignment model for early-type galaixes 
     from Okumura, Jing & Li (2009), arxiv:0809.3790
     """
-    def __init__(self, gal_type='centrals', **kwargs):
+    def __init__(self, gal_type='centrals', prim_gal_axis='major', **kwargs):
         """
+        Parameters
+        ----------
+        prim_gal_axis :  string, optional
+            string indicating which galaxy principle axis is correlated with the halo alignment axis.
+            The options are: `major`, `intermediate`, and `minor`.
         """
 
         self.gal_type = gal_type
 
+        # set which galaxy axis is correlated with the halo alignment vector
+        possible_axis = ['major', 'intermediate', 'minor']
+        if prim_gal_axis in possible_axis:
+            if prim_gal_axis == possible_axis[0]: self.prim_gal_axis = 'A'
+            elif prim_gal_axis == possible_axis[1]: self.prim_gal_axis = 'B'
+            elif prim_gal_axis == possible_axis[2]: self.prim_gal_axis = 'C'
+        else:
+            msg = ('`prim_gal_axis` must be one of {0}, but instead is {1}.'.format(possible_axis, prim_gal_axis))
+            raise ValueError(msg)
+
         self._mock_generation_calling_sequence = (['assign_orientation'])
 
         self._galprop_dtypes_to_allocate = np.dtype(
@@ -812,13 +811,17 @@ class Okumura09CentralAlignment():
         N = len(Ax)
 
         # set prim_gal_axis orientation
-        major_input_vectors = np.vstack((Ax, Ay, Az)).T
+        major_input_vectors = np.empty((N, 3))
+        major_input_vectors[:, 0] = Ax
+        major_input_vectors[:, 1] = Ay
+        major_input_vectors[:, 2] = Az
+        # the halo axes need not be unit vectors
+        major_input_vectors = normalized_vectors(major_input_vectors)
         theta_ma = self.misalignment_rvs(size=N)
 
         # rotate alignment vector by theta_ma
         ran_vecs = random_unit_vectors_3d(N)
-        mrot = rotation_matrices_from_angles(theta_ma, ran_vecs)
-        A_v = rotate_vector_collection(rotm, major_input_vectors)
+        A_v = _rotate_vectors_about_axes(theta_ma, ran_vecs, major_input_vectors)
 
         # randomly set secondary axis orientation
         B_v = random_perpendicular_directions(A_v)
@@ -827,21 +830,12 @@ class Okumura09CentralAlignment():
         C_v = vectors_normal_to_planes(A_v, B_v)
 
         # depending on the prim_gal_axis, assign correlated axes
-        if self.prim_gal_axis == 'A':
-            major_v = A_v
-            inter_v = B_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'B':
-            major_v = B_v
-            inter_v = A_v
-            minor_v = C_v
-        elif self.prim_gal_axis == 'C':
-            major_v = B_v
-            inter_v = C_v
-            minor_v = A_v
-        else:
+        try:
+            axis_order = _prim_gal_axis_order[self.prim_gal_axis]
+        except KeyError:
             msg = ('primary galaxy axis {0} is not recognized.'.format(self.prim_gal_axis))
             raise ValueError(msg)
+        major_v, inter_v, minor_v = [(A_v, B_v, C_v)[i] for i in axis_order]
 
         if 'table' in kwargs.keys():
             try:
@@ -858,18 +852,42 @@ class Okumura09CentralAlignment():
                     table[key] = 0.0
 
             # add orientations to the galaxy table
-            table['galaxy_axisA_x'][mask] = major_v[mask, 0]
-            table['galaxy_axisA_y'][mask] = major_v[mask, 1]
-            table['galaxy_axisA_z'][mask] = major_v[mask, 2]
-
-            table['galaxy_axisB_x'][mask] = inter_v[mask, 0]
-            table['galaxy_axisB_y'][mask] = inter_v[mask, 1]
-            table['galaxy_axisB_z'][mask] = inter_v[mask, 2]
-
-            table['galaxy_axisC_x'][mask] = minor_v[mask, 0]
-            table['galaxy_axisC_y'][mask] = minor_v[mask, 1]
-            table['galaxy_axisC_z'][mask] = minor_v[mask, 2]
+            _add_orientations_to_table(table, mask, major_v, inter_v, minor_v)
 
             return table
         else:
-            return major_v, inter_v, minor_v
\ No newline at end of file
+            return major_v, inter_v, minor_v
+
+
+def _rotate_vectors_about_axes(angles, axes, vectors):
+    r"""
+    Rotate each of `vectors` by the corresponding angle about the corresponding axis.
+
+    Parameters
+    ----------
+    angles : ndarray
+        Numpy array of shape (npts, ) storing rotation angles in radians
+
+    axes : ndarray
+        Numpy array of shape (npts, 3) storing a list of 3d unit-vectors defining the rotation axes
+
+    vectors : ndarray
+        Numpy array of shape (npts, 3) storing a list of 3d vectors to be rotated
+
+    Returns
+    -------
+    rotated_vectors : ndarray
+        Numpy array of shape (npts, 3)
+
+    Notes
+    -----
+    This applies Rodrigues' rotation formula directly. It is equivalent to
+    ``rotate_vector_collection(rotation_matrices_from_angles(angles, axes), vectors)``
+    without building the (npts, 3, 3) array of rotation matrices.
+    """
+
+    cos_a = np.cos(angles)[:, np.newaxis]
+    sin_a = np.sin(angles)[:, np.newaxis]
+    k_dot_v = elementwise_dot(axes, vectors)[:, np.newaxis]
+
+    return vectors*cos_a + np.cross(axes, vectors)*sin_a + axes*(k_dot_v*(1.0 - cos_a))